@@ -4,43 +4,333 @@ eCourts Case Listing Fetcher
 Fetches case listings from eCourts website and checks for today's/tomorrow's listings
 """
 
-import requests
+import copy
+import functools
+import hashlib
+import importlib.util
 import json
 import argparse
 import sys
 import os
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin
+import lxml.html
+from lxml import etree
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import time
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
 
-class ECourtsScraper:
+# urllib3 and aiohttp decode br only when brotli is installed; find_spec checks without importing it
+_ACCEPT_ENCODING = 'br, gzip, deflate' if importlib.util.find_spec('brotli') else 'gzip, deflate'
+
+# CNR: 4-letter state/district code, 2-digit establishment, 6-digit case number, 4-digit year
+_CNR_RE = re.compile(r'^[A-Z]{4}[0-9]{2}[0-9]{6}[0-9]{4}$')
+
+# Raw response bodies are cached on disk; case histories change less often than cause lists
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ecourts')
+CASE_CACHE_TTL = 24 * 3600
+CAUSE_LIST_CACHE_TTL = 6 * 3600
+
+# Selectors are compiled once at import; class tests match whole tokens like CSS `.table`
+_HAS_TABLE_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' table ')"
+_HAS_BORDERED_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' table-bordered ')"
+_CASE_TABLE_XP = etree.XPath(f"//table[{_HAS_TABLE_CLASS} and not({_HAS_BORDERED_CLASS})]")
+_HEARING_TABLE_XP = etree.XPath(f"//table[{_HAS_TABLE_CLASS} and {_HAS_BORDERED_CLASS}]")
+_ROWS_XP = etree.XPath(".//tr")
+_CELLS_XP = etree.XPath("./td")
+
+_CAUSE_LIST_FIELDS = ('serial_number', 'case_number', 'parties', 'purpose')
+
+def _cell_text(cell) -> str:
+    """Whitespace-normalized text of a table cell (like XPath normalize-space)"""
+    return ' '.join(''.join(cell.itertext()).split())
+
+def _node_text(elem) -> str:
+    """Concatenate stripped text of an element and its descendants (like BeautifulSoup's get_text(strip=True))"""
+    return ''.join(text.strip() for text in elem.itertext())
+
+@functools.lru_cache(maxsize=1)
+def _listing_date_strs(day_ordinal: int) -> Tuple[str, str]:
+    """Format the given day and the next as dd/mm/YYYY (the eCourts hearing date format)"""
+    fmt = lambda d: f"{d.day:02d}/{d.month:02d}/{d.year}"
+    today = datetime.fromordinal(day_ordinal)
+    return fmt(today), fmt(today + timedelta(days=1))
+
+def _today_tomorrow_strs() -> Tuple[str, str]:
+    """Today's and tomorrow's hearing date strings, formatted once per process-day"""
+    return _listing_date_strs(datetime.now().toordinal())
+
+class _CauseListParser:
+    """Incremental cause list parser: feed raw HTML chunks, get case entries back as rows close"""
+    def __init__(self, date: str):
+        self.date = date
+        # eCourts serves UTF-8; pinning it skips libxml2's charset sniffing
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8')
+        self._tables = {}  # open <table class="table"> element -> [court_name, rows_seen]
+        self._current_court = "Unknown Court"  # text of the latest h3/h4 heading
+        self.found_table = False
+        self._has_content = False
+
+    def feed(self, chunk) -> Iterator[Dict]:
+        self._has_content = self._has_content or bool(chunk.strip())
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> Iterator[Dict]:
+        # libxml2 rejects an empty document; an empty body is simply an empty cause list
+        if self._has_content:
+            self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> Iterator[Dict]:
+        for event, elem in self._parser.read_events():
+            tag = elem.tag
+            if event == 'start':
+                if tag == 'table' and 'table' in (elem.get('class') or '').split():
+                    self._tables[elem] = [self._current_court, 0]
+                    self.found_table = True
+            elif tag in ('h3', 'h4'):
+                self._current_court = _node_text(elem)
+            elif tag == 'table':
+                self._tables.pop(elem, None)
+            elif tag == 'tr':
+                table = next(elem.iterancestors('table'), None)
+                state = self._tables.get(table)
+                if state is not None:
+                    state[1] += 1
+                    cells = _CELLS_XP(elem)
+                    if state[1] > 1 and len(cells) >= 4:  # Skip header row
+                        case_entry = {'date': self.date}
+                        case_entry.update(zip(_CAUSE_LIST_FIELDS, map(_cell_text, cells[:4])))
+                        case_entry['court_name'] = state[0]
+                        yield case_entry
+                    # Free the finished row and any rows before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+@functools.lru_cache(maxsize=256)
+def _parse_case_response_cached(html_content: bytes, today: str, tomorrow: str) -> Tuple[Dict, bool]:
+    """Parse a case history page into (case details, whether it had a case table); memoized so re-parsing an identical body is a lookup"""
+    # eCourts serves UTF-8; pinning it skips charset detection. Parsers are cheap and not
+    # shareable across threads, so each call gets its own
+    try:
+        tree = lxml.html.fromstring(html_content, parser=lxml.html.HTMLParser(encoding='utf-8'))
+    except etree.ParserError:
+        # A body with no elements (empty, whitespace, a lone comment) is eCourts' "no record" answer
+        tree = lxml.html.fromstring(b'<html></html>')
+    
+    case_info = {}
+    
+    # Extract basic case information
+    case_tables = _CASE_TABLE_XP(tree)
+    if case_tables:
+        for row in _ROWS_XP(case_tables[0]):
+            cells = _CELLS_XP(row)
+            if len(cells) >= 2:
+                key = _node_text(cells[0]).replace(':', '')
+                value = _node_text(cells[1])
+                if key and value:
+                    case_info[key] = value
+    
+    # Extract hearing dates, checking for today's/tomorrow's listing in the same pass
+    today_hearing = tomorrow_hearing = None
+    hearing_dates = []
+    hearing_tables = _HEARING_TABLE_XP(tree)
+    if hearing_tables:
+        rows = _ROWS_XP(hearing_tables[0])[1:]  # Skip header
+        for row in rows:
+            cells = _CELLS_XP(row)
+            if len(cells) >= 3:
+                hearing_date, purpose, stage = map(_cell_text, cells[:3])
+                
+                if hearing_date:
+                    hearing = {
+                        'date': hearing_date,
+                        'purpose': purpose,
+                        'stage': stage
+                    }
+                    hearing_dates.append(hearing)
+                    if hearing_date == today:
+                        today_hearing = hearing
+                    elif hearing_date == tomorrow:
+                        tomorrow_hearing = hearing
+    
+    case_info['hearing_dates'] = hearing_dates
+    case_info['listed_today'] = today_hearing is not None
+    case_info['listed_tomorrow'] = tomorrow_hearing is not None
+    case_info['next_hearing'] = today_hearing or tomorrow_hearing
+    case_info['serial_number'] = None
+    case_info['court_name'] = None
+    
+    return case_info, bool(case_tables or hearing_tables)
+
+class _CacheSpool:
+    """Spool a response body to a temp file beside `path`; it replaces `path` only if commit() is called.
+
+    Caching is best-effort: any OSError (read-only or missing cache dir, full disk) just stops
+    spooling, so the fetch itself still succeeds.
+    """
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._file = None
+        self._tmp_path = None
+
+    def __enter__(self):
+        if self.path is not None:
+            try:
+                directory = os.path.dirname(self.path)
+                os.makedirs(directory, exist_ok=True)
+                fd, self._tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                self._file = os.fdopen(fd, 'wb')
+            except OSError:
+                self._discard()
+        return self
+
+    def write(self, chunk: bytes):
+        if self._file is not None:
+            try:
+                self._file.write(chunk)
+            except OSError:
+                self._discard()
+
+    def commit(self):
+        """Publish the spooled body; the rename is atomic so readers never see a partial file"""
+        if self._file is not None:
+            try:
+                self._file.close()
+                os.replace(self._tmp_path, self.path)
+            except OSError:
+                self._discard()
+            self._file = self._tmp_path = None
+
+    def __exit__(self, exc_type, exc, tb):
+        self._discard()
+
+    def _discard(self):
+        """Drop the spooled body, ignoring cleanup errors"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        if self._tmp_path is not None:
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass
+        self._file = self._tmp_path = None
+
+class _ECourtsBase:
+    """Endpoint configuration and HTML parsing shared by the sync and async scrapers"""
     def __init__(self):
         self.base_url = "https://services.ecourts.gov.in/ecourtindia_v6/"
+        # Endpoint URLs are built once; every request to an endpoint reuses the same string
+        self.cnr_url = urljoin(self.base_url, '?p=case_history/index')
+        self.case_url = urljoin(self.base_url, '?p=case_history/case_history')
+        self.causelist_url = urljoin(self.base_url, '?p=causelist/index')
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': _ACCEPT_ENCODING
+        }
+
+    def _parse_case_response(self, html_content: bytes, **identifiers) -> Dict:
+        """Parse the HTML response to extract case details"""
+        return self._parse_case_page(html_content, **identifiers)[0]
+
+    def _parse_case_page(self, html_content: bytes, **identifiers) -> Tuple[Dict, bool]:
+        """Like _parse_case_response, also reporting whether the page had a case table"""
+        today, tomorrow = _today_tomorrow_strs()
+        parsed, found_table = _parse_case_response_cached(html_content, today, tomorrow)
+        case_info = dict(identifiers)
+        # Deep copy so callers can't mutate the memoized result
+        case_info.update(copy.deepcopy(parsed))
+        return case_info, found_table
+
+    def _parse_cause_list(self, chunks: Iterable[bytes], date: str) -> Iterator[Dict]:
+        """Parse cause list HTML incrementally, yielding entries while the body is still arriving"""
+        parser = _CauseListParser(date)
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+class ECourtsScraper(_ECourtsBase):
+    def __init__(self, cache_dir: Optional[str] = CACHE_DIR):
+        # requests is imported here so `--help` and argument errors don't pay for it
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        super().__init__()
+        self.cache_dir = cache_dir  # None disables the response cache
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session.headers.update(self.headers)
+        # Pool connections to the eCourts host so repeat requests skip the TCP/TLS handshake
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({'GET', 'POST'}))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        self.session.mount('https://', adapter)
         
+    def _cache_path(self, url: str, data: Dict) -> Optional[str]:
+        """Cache file for a request, or None when caching is disabled"""
+        if not self.cache_dir:
+            return None
+        # Hashing the request keeps user-supplied values out of the cache path
+        key = hashlib.blake2b(json.dumps([url, data], sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    @staticmethod
+    def _open_cache(path: Optional[str], ttl: int):
+        """Open a cache file younger than `ttl` seconds for reading; None on a miss or an unreadable entry"""
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                return open(path, 'rb')
+        except OSError:
+            pass
+        return None
+
+    def _fetch_case(self, url: str, data: Dict, **identifiers) -> Dict:
+        """POST a case search, reusing a cached body and caching bodies that held a case table"""
+        path = self._cache_path(url, data)
+        cached = self._open_cache(path, CASE_CACHE_TTL)
+        if cached is not None:
+            with cached as f:
+                return self._parse_case_response(f.read(), **identifiers)
+        
+        response = self.session.post(url, data=data)
+        case_info, found_table = self._parse_case_page(response.content, **identifiers)
+        # eCourts answers errors and "no record" with HTTP 200, so only keep pages that parsed into a case
+        if response.ok and found_table:
+            with _CacheSpool(path) as spool:
+                spool.write(response.content)
+                spool.commit()
+        return case_info
+
     def get_case_details_by_cnr(self, cnr_number: str) -> Dict:
         """Get case details using CNR number"""
+        # Reject malformed CNRs locally instead of paying a round-trip for the server's error page
+        cnr_number = cnr_number.strip().upper()
+        if not _CNR_RE.match(cnr_number):
+            return {"error": f"Invalid CNR number format: {cnr_number}"}
+        
         try:
-            search_url = f"{self.base_url}?p=case_history/index"
             data = {
                 'cnr_number': cnr_number,
                 'action': 'cnr_search'
             }
             
-            response = self.session.post(search_url, data=data)
-            return self._parse_case_response(response.text, cnr_number=cnr_number)
+            return self._fetch_case(self.cnr_url, data, cnr_number=cnr_number)
         except Exception as e:
             return {"error": f"Failed to fetch case details: {str(e)}"}
 
     def get_case_details_by_number(self, case_type: str, case_number: str, case_year: str, state_code: str, dist_code: str, court_code: str) -> Dict:
         """Get case details using case type, number, and year"""
         try:
-            search_url = f"{self.base_url}?p=case_history/case_history"
             data = {
                 'state_code': state_code,
                 'dist_code': dist_code, 
@@ -51,78 +341,129 @@ class ECourtsScraper:
                 'action': 'case_history'
             }
             
-            response = self.session.post(search_url, data=data)
-            return self._parse_case_response(response.text, case_number=f"{case_type}/{case_number}/{case_year}")
+            return self._fetch_case(self.case_url, data, case_number=f"{case_type}/{case_number}/{case_year}")
         except Exception as e:
             return {"error": f"Failed to fetch case details: {str(e)}"}
 
-    def _parse_case_response(self, html_content: str, **identifiers) -> Dict:
-        """Parse the HTML response to extract case details"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        case_info = {}
-        case_info.update(identifiers)
-        
-        # Extract basic case information
-        case_details_table = soup.find('table', class_='table')
-        if case_details_table:
-            rows = case_details_table.find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 2:
-                    key = cells[0].get_text(strip=True).replace(':', '')
-                    value = cells[1].get_text(strip=True)
-                    if key and value:
-                        case_info[key] = value
-        
-        # Extract hearing dates
-        hearing_dates = []
-        hearing_table = soup.find('table', class_='table table-bordered')
-        if hearing_table:
-            rows = hearing_table.find_all('tr')[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 3:
-                    hearing_date = cells[0].get_text(strip=True)
-                    purpose = cells[1].get_text(strip=True)
-                    stage = cells[2].get_text(strip=True)
-                    
-                    if hearing_date:
-                        hearing_dates.append({
-                            'date': hearing_date,
-                            'purpose': purpose,
-                            'stage': stage
-                        })
-        
-        case_info['hearing_dates'] = hearing_dates
-        
-        # Check if listed today or tomorrow
-        today = datetime.now().strftime('%d/%m/%Y')
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%d/%m/%Y')
+    def download_cause_list(self, state_code: str, dist_code: str, court_code: str, date: str = None) -> List[Dict]:
+        """Download entire cause list for a specific date"""
+        try:
+            return list(self.iter_cause_list(state_code, dist_code, court_code, date))
+        except Exception as e:
+            return {"error": f"Failed to download cause list: {str(e)}"}
+
+    def iter_cause_list(self, state_code: str, dist_code: str, court_code: str, date: str = None) -> Iterator[Dict]:
+        """Stream cause list entries as the response downloads, without holding the whole page"""
+        if not date:
+            date = datetime.now().strftime('%d-%m-%Y')
+            
+        data = {
+            'state_code': state_code,
+            'dist_code': dist_code,
+            'court_code': court_code,
+            'causelist_date': date,
+            'action': 'causelist'
+        }
         
-        case_info['listed_today'] = False
-        case_info['listed_tomorrow'] = False
-        case_info['next_hearing'] = None
-        case_info['serial_number'] = None
-        case_info['court_name'] = None
+        path = self._cache_path(self.causelist_url, data)
+        cached = self._open_cache(path, CAUSE_LIST_CACHE_TTL)
+        if cached is not None:
+            with cached as f:
+                yield from self._parse_cause_list(iter(lambda: f.read(8192), b''), date)
+            return
         
-        for hearing in hearing_dates:
-            if hearing['date'] == today:
-                case_info['listed_today'] = True
-                case_info['next_hearing'] = hearing
-            elif hearing['date'] == tomorrow:
-                case_info['listed_tomorrow'] = True
-                case_info['next_hearing'] = hearing
+        with self.session.post(self.causelist_url, data=data, stream=True) as response, _CacheSpool(path) as spool:
+            parser = _CauseListParser(date)
+            for chunk in response.iter_content(chunk_size=8192):
+                spool.write(chunk)
+                yield from parser.feed(chunk)
+            yield from parser.close()
+            # eCourts answers errors and empty lists with HTTP 200, so only keep pages that had a cause list table
+            if response.ok and parser.found_table:
+                spool.commit()
+
+class AsyncECourtsScraper(_ECourtsBase):
+    """Concurrent scraper built on aiohttp; use as `async with AsyncECourtsScraper() as scraper:`"""
+    def __init__(self, concurrency: int = 16):
+        super().__init__()
+        # aiohttp is imported lazily in open(); only the async scraper needs it
+        if importlib.util.find_spec('aiohttp') is None:
+            raise ImportError("AsyncECourtsScraper requires aiohttp (pip install aiohttp)")
+        self.concurrency = concurrency
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the shared aiohttp session (must run inside the event loop)"""
+        if self.session is None:
+            import asyncio
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit_per_host=self.concurrency, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def close(self):
+        """Close the shared aiohttp session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _post(self, url: str, data: Dict) -> bytes:
+        """POST form data and return the response body, capped at `concurrency` requests in flight"""
+        await self.open()
+        async with self._semaphore:
+            async with self.session.post(url, data=data) as response:
+                return await response.read()
+
+    async def get_case_details_by_cnr(self, cnr_number: str) -> Dict:
+        """Get case details using CNR number"""
+        # Reject malformed CNRs locally instead of paying a round-trip for the server's error page
+        cnr_number = cnr_number.strip().upper()
+        if not _CNR_RE.match(cnr_number):
+            return {"error": f"Invalid CNR number format: {cnr_number}"}
         
-        return case_info
+        try:
+            data = {
+                'cnr_number': cnr_number,
+                'action': 'cnr_search'
+            }
+            
+            html_content = await self._post(self.cnr_url, data)
+            return self._parse_case_response(html_content, cnr_number=cnr_number)
+        except Exception as e:
+            return {"error": f"Failed to fetch case details: {str(e)}"}
 
-    def download_cause_list(self, state_code: str, dist_code: str, court_code: str, date: str = None) -> List[Dict]:
+    async def get_case_details_by_number(self, case_type: str, case_number: str, case_year: str, state_code: str, dist_code: str, court_code: str) -> Dict:
+        """Get case details using case type, number, and year"""
+        try:
+            data = {
+                'state_code': state_code,
+                'dist_code': dist_code,
+                'court_code': court_code,
+                'case_type': case_type,
+                'case_no': case_number,
+                'year': case_year,
+                'action': 'case_history'
+            }
+            
+            html_content = await self._post(self.case_url, data)
+            return self._parse_case_response(html_content, case_number=f"{case_type}/{case_number}/{case_year}")
+        except Exception as e:
+            return {"error": f"Failed to fetch case details: {str(e)}"}
+
+    async def download_cause_list(self, state_code: str, dist_code: str, court_code: str, date: str = None) -> List[Dict]:
         """Download entire cause list for a specific date"""
         if not date:
             date = datetime.now().strftime('%d-%m-%Y')
             
         try:
-            cause_list_url = f"{self.base_url}?p=causelist/index"
             data = {
                 'state_code': state_code,
                 'dist_code': dist_code,
@@ -131,50 +472,59 @@ class ECourtsScraper:
                 'action': 'causelist'
             }
             
-            response = self.session.post(cause_list_url, data=data)
-            return self._parse_cause_list(response.text, date)
+            await self.open()
+            async with self._semaphore:
+                async with self.session.post(self.causelist_url, data=data) as response:
+                    # Parse chunks as they arrive instead of buffering the whole page
+                    parser = _CauseListParser(date)
+                    cause_list = []
+                    async for chunk in response.content.iter_chunked(8192):
+                        cause_list.extend(parser.feed(chunk))
+                    cause_list.extend(parser.close())
+                    return cause_list
         except Exception as e:
             return {"error": f"Failed to download cause list: {str(e)}"}
 
-    def _parse_cause_list(self, html_content: str, date: str) -> List[Dict]:
-        """Parse cause list HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        cause_list = []
-        
-        tables = soup.find_all('table', class_='table')
-        for table in tables:
-            rows = table.find_all('tr')[1:]  # Skip header row
-            
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 4:
-                    case_entry = {
-                        'date': date,
-                        'serial_number': cells[0].get_text(strip=True),
-                        'case_number': cells[1].get_text(strip=True),
-                        'parties': cells[2].get_text(strip=True),
-                        'purpose': cells[3].get_text(strip=True),
-                        'court_name': self._extract_court_name(table)
-                    }
-                    cause_list.append(case_entry)
-        
-        return cause_list
+    async def fetch_many_cnrs(self, cnrs: List[str]) -> List[Dict]:
+        """Fetch case details for many CNR numbers concurrently, preserving input order"""
+        import asyncio
+        results = await asyncio.gather(*[self.get_case_details_by_cnr(c) for c in cnrs], return_exceptions=True)
+        return [
+            {"error": f"Failed to fetch case details: {str(r)}"} if isinstance(r, BaseException) else r
+            for r in results
+        ]
 
-    def _extract_court_name(self, table_element) -> str:
-        """Extract court name from table context"""
-        # Look for court name in previous elements or table attributes
-        prev_element = table_element.find_previous('h3') or table_element.find_previous('h4')
-        if prev_element:
-            return prev_element.get_text(strip=True)
-        return "Unknown Court"
+def _import_orjson():
+    """Import orjson on first save so `--help` and argument errors don't load it; None when it isn't installed"""
+    try:
+        import orjson
+    except ImportError:  # fall back to the stdlib json encoder
+        return None
+    return orjson
 
 def save_to_json(data, filename: str):
     """Save data to JSON file"""
+    orjson = _import_orjson()
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 def save_to_text(data, filename: str):
     """Save data to text file"""
+    orjson = _import_orjson()
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            if isinstance(data, list):
+                # One entry at a time, so a large cause list is never encoded as a single blob
+                for item in data:
+                    f.write(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS))
+                    f.write(b'\n')
+            else:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        return
     with open(filename, 'w', encoding='utf-8') as f:
         if isinstance(data, list):
             for item in data:
@@ -219,12 +569,28 @@ def print_case_info(case_info: Dict):
         if case_info.get('next_hearing'):
             print(f"   Next Hearing: {case_info['next_hearing'].get('date', 'N/A')}")
 
+def _cnr_list(value: str) -> List[str]:
+    """argparse type for --cnr: split and validate a comma-separated list of CNR numbers"""
+    return _validate_cnrs(value.split(','))
+
+def _validate_cnrs(values: Iterable[str]) -> List[str]:
+    """Strip and uppercase CNR numbers, dropping blanks; raise ArgumentTypeError if any is malformed"""
+    cnrs = [cnr.strip().upper() for cnr in values if cnr.strip()]
+    if not cnrs:
+        raise argparse.ArgumentTypeError("expected at least one CNR number")
+    invalid = [cnr for cnr in cnrs if not _CNR_RE.match(cnr)]
+    if invalid:
+        raise argparse.ArgumentTypeError(f"invalid CNR number format: {', '.join(invalid)} (expected 16 characters like MHAU010012342019)")
+    return cnrs
+
 def main():
     parser = argparse.ArgumentParser(description='eCourts Case Listing Fetcher')
     
     # Case search methods
     case_group = parser.add_argument_group('Case Search Options')
-    case_group.add_argument('--cnr', help='Search by CNR number')
+    case_group.add_argument('--cnr', type=_cnr_list, help='Search by CNR number (comma-separated for several)')
+    case_group.add_argument('--cnr-file', help='Search by CNR numbers listed one per line in a file')
+    case_group.add_argument('--stdin-cnr', action='store_true', help='Read CNR numbers line by line from stdin, reusing one session')
     case_group.add_argument('--case-type', help='Case type (e.g., CIVIL, CRIMINAL)')
     case_group.add_argument('--case-number', help='Case number')
     case_group.add_argument('--case-year', help='Case year')
@@ -242,14 +608,16 @@ def main():
     output_group = parser.add_argument_group('Output Options')
     output_group.add_argument('--output', '-o', help='Output filename (without extension)')
     output_group.add_argument('--format', choices=['json', 'text'], default='json', help='Output format')
+    output_group.add_argument('--no-cache', action='store_true', help=f'Always fetch fresh data instead of reusing responses cached in {CACHE_DIR}')
     
     args = parser.parse_args()
     
-    scraper = ECourtsScraper()
-    
     # Validate arguments
-    if not any([args.cnr, args.case_type, args.causelist]):
-        parser.error("Must specify either --cnr, --case-type with other case details, or --causelist")
+    if not any([args.cnr, args.cnr_file, args.stdin_cnr, args.case_type, args.causelist]):
+        parser.error("Must specify either --cnr/--cnr-file/--stdin-cnr, --case-type with other case details, or --causelist")
+    
+    if args.stdin_cnr and (args.cnr or args.cnr_file):
+        parser.error("--stdin-cnr cannot be combined with --cnr or --cnr-file")
     
     if args.case_type and not all([args.case_number, args.case_year, args.state_code, args.dist_code, args.court_code]):
         parser.error("When using --case-type, must also provide --case-number, --case-year, --state-code, --dist-code, --court-code")
@@ -257,19 +625,50 @@ def main():
     if args.causelist and not all([args.state_code, args.dist_code, args.court_code]):
         parser.error("When using --causelist, must provide --state-code, --dist-code, --court-code")
     
+    cnrs = list(args.cnr or [])
+    if args.cnr_file:
+        # File entries get the same checks --cnr applies at parse time
+        try:
+            with open(args.cnr_file, encoding='utf-8') as f:
+                cnrs.extend(_validate_cnrs(f))
+        except OSError as e:
+            parser.error(f"Cannot read --cnr-file: {e}")
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"argument --cnr-file: {e}")
+    
+    scraper = ECourtsScraper(cache_dir=None if args.no_cache else CACHE_DIR)
+    
     try:
         # Case search by CNR
-        if args.cnr:
-            print(f"Searching for case with CNR: {args.cnr}")
-            case_info = scraper.get_case_details_by_cnr(args.cnr)
-            print_case_info(case_info)
+        if cnrs or args.stdin_cnr:
+            if args.stdin_cnr:
+                # Look up each CNR as it arrives, sharing the session set up above
+                result = []
+                for line in sys.stdin:
+                    cnr = line.strip()
+                    if cnr:
+                        print(f"Searching for case with CNR: {cnr}")
+                        case_info = scraper.get_case_details_by_cnr(cnr)
+                        print_case_info(case_info)
+                        result.append(case_info)
+            elif len(cnrs) == 1:
+                print(f"Searching for case with CNR: {cnrs[0]}")
+                result = scraper.get_case_details_by_cnr(cnrs[0])
+                print_case_info(result)
+            else:
+                print(f"Searching for {len(cnrs)} cases by CNR")
+                # The session is safe to share across threads and its adapter pools enough connections
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    result = list(executor.map(scraper.get_case_details_by_cnr, cnrs))
+                for case_info in result:
+                    print_case_info(case_info)
             
             if args.output:
                 filename = f"{args.output}.{args.format}"
                 if args.format == 'json':
-                    save_to_json(case_info, filename)
+                    save_to_json(result, filename)
                 else:
-                    save_to_text(case_info, filename)
+                    save_to_text(result, filename)
                 print(f"\nResults saved to: {filename}")
         
         # Case search by case details
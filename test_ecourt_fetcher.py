@@ -0,0 +1,257 @@
+"""
+Fixture-based checks for the eCourts HTML parsers (no network access)
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import pytest
+
+import ecourt_fetcher
+from ecourt_fetcher import _CauseListParser, _ECourtsBase
+
+CAUSE_LIST_HTML = """<html><head><meta charset="utf-8"></head><body>
+<h3>District Court</h3>
+<div>
+  <h4>Court No. 1</h4>
+  <table class="table">
+    <tr><th>Sr</th><th>Case</th><th>Parties</th><th>Purpose</th></tr>
+    <tr><td>1</td><td>CS/10/2020</td><td>Ram <b>vs</b>
+        Shyam</td><td>Evidence</td></tr>
+    <tr><td>short</td><td>row</td></tr>
+  </table>
+</div>
+<h4>Court No. 2</h4>
+<table class="table table-bordered">
+  <thead><tr><th>Sr</th><th>Case</th><th>Parties</th><th>Purpose</th></tr></thead>
+  <tbody>
+    <tr><td>2</td><td>CR/5/2021</td><td>राम vs श्याम</td><td>Orders</td></tr>
+    <tr><td>3</td><td>CR/6/2021</td><td>A vs B</td><td>Arguments</td></tr>
+  </tbody>
+</table>
+<table class="other"><tr><td>x</td><td>x</td><td>x</td><td>x</td></tr><tr><td>9</td><td>9</td><td>9</td><td>9</td></tr></table>
+</body></html>""".encode('utf-8')
+
+EXPECTED_CAUSE_LIST = [
+    {'date': '15-10-2026', 'serial_number': '1', 'case_number': 'CS/10/2020',
+     'parties': 'Ram vs Shyam', 'purpose': 'Evidence', 'court_name': 'Court No. 1'},
+    {'date': '15-10-2026', 'serial_number': '2', 'case_number': 'CR/5/2021',
+     'parties': 'राम vs श्याम', 'purpose': 'Orders', 'court_name': 'Court No. 2'},
+    {'date': '15-10-2026', 'serial_number': '3', 'case_number': 'CR/6/2021',
+     'parties': 'A vs B', 'purpose': 'Arguments', 'court_name': 'Court No. 2'},
+]
+
+def parse_cause_list(chunks):
+    return list(_ECourtsBase()._parse_cause_list(chunks, '15-10-2026'))
+
+def test_cause_list_skips_headers_and_uses_nearest_heading():
+    assert parse_cause_list([CAUSE_LIST_HTML]) == EXPECTED_CAUSE_LIST
+
+def test_cause_list_rows_split_across_chunks():
+    # One byte per chunk splits every row, tag and multi-byte character
+    chunks = [CAUSE_LIST_HTML[i:i + 1] for i in range(len(CAUSE_LIST_HTML))]
+    assert parse_cause_list(chunks) == EXPECTED_CAUSE_LIST
+
+def test_cause_list_empty_body():
+    parser = _CauseListParser('15-10-2026')
+    assert list(parser.feed(b'  ')) + list(parser.close()) == []
+    assert not parser.found_table
+
+def case_page(*hearing_dates):
+    rows = ''.join(f'<tr><td>{d}</td><td>Hearing {d}</td><td>Stage</td></tr>' for d in hearing_dates)
+    return (
+        '<html><body>'
+        '<table class="table"><tr><td>Case Type:</td><td> CIVIL </td></tr></table>'
+        f'<table class="table table-bordered"><tr><th>Date</th></tr>{rows}</table>'
+        '</body></html>'
+    ).encode('utf-8')
+
+def test_case_response_prefers_today_over_tomorrow(monkeypatch):
+    monkeypatch.setattr(ecourt_fetcher, '_today_tomorrow_strs', lambda: ('15/10/2026', '16/10/2026'))
+    case_info = _ECourtsBase()._parse_case_response(case_page('16/10/2026', '15/10/2026', '01/01/2020'), cnr_number='X')
+    assert case_info['Case Type'] == 'CIVIL'
+    assert [h['date'] for h in case_info['hearing_dates']] == ['16/10/2026', '15/10/2026', '01/01/2020']
+    assert case_info['listed_today'] and case_info['listed_tomorrow']
+    assert case_info['next_hearing']['date'] == '15/10/2026'
+
+def test_case_response_body_without_elements():
+    for body in (b'', b'   ', b'<!-- x -->'):
+        case_info = _ECourtsBase()._parse_case_response(body, cnr_number='X')
+        assert case_info['hearing_dates'] == []
+        assert case_info['listed_today'] is False
+        assert 'error' not in case_info
+
+def test_case_response_with_xml_declaration():
+    body = b'<?xml version="1.0" encoding="utf-8"?>' + case_page()
+    assert _ECourtsBase()._parse_case_response(body, cnr_number='X')['Case Type'] == 'CIVIL'
+
+CNR = 'MHAU010012342019'
+
+class FakeResponse:
+    def __init__(self, body: bytes, ok: bool = True):
+        self.content = body
+        self.ok = ok
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+class FakeSession:
+    """Stands in for requests.Session, counting the POSTs that reach the network"""
+    def __init__(self, body: bytes, ok: bool = True):
+        self.body = body
+        self.ok = ok
+        self.calls = 0
+
+    def post(self, url, data=None, stream=False):
+        self.calls += 1
+        return FakeResponse(self.body, self.ok)
+
+def make_scraper(cache_dir, body: bytes, ok: bool = True):
+    scraper = ecourt_fetcher.ECourtsScraper(cache_dir=str(cache_dir))
+    scraper.session = FakeSession(body, ok)
+    return scraper
+
+def expire_cache(cache_dir, age: int):
+    for entry in cache_dir.iterdir():
+        os.utime(entry, (time.time() - age, time.time() - age))
+
+def test_case_cache_miss_then_hit(tmp_path):
+    scraper = make_scraper(tmp_path, case_page())
+    first = scraper.get_case_details_by_cnr(CNR)
+    second = scraper.get_case_details_by_cnr(CNR)
+    assert first == second and first['Case Type'] == 'CIVIL'
+    assert scraper.session.calls == 1
+    assert [p.suffix for p in tmp_path.iterdir()] == ['.html']
+
+def test_case_cache_expires_after_ttl(tmp_path):
+    scraper = make_scraper(tmp_path, case_page())
+    scraper.get_case_details_by_cnr(CNR)
+    expire_cache(tmp_path, ecourt_fetcher.CASE_CACHE_TTL + 1)
+    scraper.get_case_details_by_cnr(CNR)
+    assert scraper.session.calls == 2
+
+def test_case_cache_skips_pages_without_a_table(tmp_path):
+    scraper = make_scraper(tmp_path, b'<html><body>No record found</body></html>')
+    scraper.get_case_details_by_cnr(CNR)
+    scraper.get_case_details_by_cnr(CNR)
+    assert scraper.session.calls == 2
+    assert list(tmp_path.iterdir()) == []
+
+def test_case_cache_skips_error_status(tmp_path):
+    scraper = make_scraper(tmp_path, case_page(), ok=False)
+    scraper.get_case_details_by_cnr(CNR)
+    assert list(tmp_path.iterdir()) == []
+
+def test_cause_list_cache_miss_hit_and_expiry(tmp_path):
+    scraper = make_scraper(tmp_path, CAUSE_LIST_HTML)
+    assert scraper.download_cause_list('1', '2', '3', '15-10-2026') == EXPECTED_CAUSE_LIST
+    assert scraper.download_cause_list('1', '2', '3', '15-10-2026') == EXPECTED_CAUSE_LIST
+    assert scraper.session.calls == 1
+    expire_cache(tmp_path, ecourt_fetcher.CAUSE_LIST_CACHE_TTL + 1)
+    scraper.download_cause_list('1', '2', '3', '15-10-2026')
+    assert scraper.session.calls == 2
+
+def test_cause_list_cache_skips_pages_without_a_table(tmp_path):
+    scraper = make_scraper(tmp_path, b'')
+    assert scraper.download_cause_list('1', '2', '3', '15-10-2026') == []
+    assert list(tmp_path.iterdir()) == []
+
+def test_unwritable_cache_does_not_fail_the_fetch(tmp_path):
+    # A regular file where the cache directory should be makes every cache write fail
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_bytes(b'')
+    scraper = make_scraper(blocker, case_page())
+    assert scraper.get_case_details_by_cnr(CNR)['Case Type'] == 'CIVIL'
+    scraper.session = FakeSession(CAUSE_LIST_HTML)
+    assert scraper.download_cause_list('1', '2', '3', '15-10-2026') == EXPECTED_CAUSE_LIST
+
+class FakeCliScraper:
+    """Replaces ECourtsScraper in main(), echoing each CNR back as its case details"""
+    def __init__(self, cache_dir=None):
+        pass
+
+    def get_case_details_by_cnr(self, cnr_number):
+        return {'cnr_number': cnr_number}
+
+def run_cli(monkeypatch, tmp_path, *argv, stdin=''):
+    """Run main() with a fake scraper and return the JSON it saved"""
+    monkeypatch.setattr(ecourt_fetcher, 'ECourtsScraper', FakeCliScraper)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(stdin))
+    output = tmp_path / 'out'
+    monkeypatch.setattr(sys, 'argv', ['ecourt_fetcher.py', *argv, '--output', str(output)])
+    ecourt_fetcher.main()
+    return json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+
+def test_cli_single_cnr_saves_a_dict(monkeypatch, tmp_path):
+    assert run_cli(monkeypatch, tmp_path, '--cnr', CNR) == {'cnr_number': CNR}
+
+def test_cli_several_cnrs_save_a_list_in_order(monkeypatch, tmp_path):
+    cnrs = [f'MHAU0100123420{n:02d}' for n in range(20)]
+    saved = run_cli(monkeypatch, tmp_path, '--cnr', ','.join(cnrs))
+    assert saved == [{'cnr_number': cnr} for cnr in cnrs]
+
+def test_cli_stdin_cnr_saves_a_list(monkeypatch, tmp_path):
+    saved = run_cli(monkeypatch, tmp_path, '--stdin-cnr', stdin=f'{CNR}\n\nMHAU010012342020\n')
+    assert saved == [{'cnr_number': CNR}, {'cnr_number': 'MHAU010012342020'}]
+
+def test_cli_cnr_file_entries_are_validated(monkeypatch, tmp_path, capsys):
+    cnr_file = tmp_path / 'cnrs.txt'
+    cnr_file.write_text(f'{CNR.lower()}\nbad\n', encoding='utf-8')
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, tmp_path, '--cnr-file', str(cnr_file))
+    assert 'argument --cnr-file: invalid CNR number format: BAD' in capsys.readouterr().err
+
+def test_cli_cnr_file_entries_are_uppercased(monkeypatch, tmp_path):
+    cnr_file = tmp_path / 'cnrs.txt'
+    cnr_file.write_text(f'{CNR.lower()}\n', encoding='utf-8')
+    assert run_cli(monkeypatch, tmp_path, '--cnr-file', str(cnr_file)) == {'cnr_number': CNR}
+
+def test_cnr_regex():
+    assert ecourt_fetcher._CNR_RE.match(CNR)
+    for bad in ('MHAU01001234201', 'MHAU0100123420190', 'MH1U010012342019', 'mhau010012342019', 'MHAU01001234201X'):
+        assert not ecourt_fetcher._CNR_RE.match(bad)
+
+def test_cnr_list_splits_strips_and_uppercases():
+    assert ecourt_fetcher._cnr_list(f' {CNR.lower()} ,, MHAU010012342020') == [CNR, 'MHAU010012342020']
+
+def test_cnr_list_rejects_bad_input():
+    with pytest.raises(argparse.ArgumentTypeError, match='expected at least one CNR number'):
+        ecourt_fetcher._cnr_list(' , ')
+    with pytest.raises(argparse.ArgumentTypeError, match=r'invalid CNR number format: BAD, X1 \(expected 16 characters'):
+        ecourt_fetcher._cnr_list(f'{CNR},bad,x1')
+
+SAVE_SAMPLES = [
+    EXPECTED_CAUSE_LIST,
+    {'cnr_number': CNR, 'hearing_dates': [{'date': '15/10/2026', 'purpose': 'राम'}], 1: None},
+]
+
+def saved_outputs(monkeypatch, tmp_path, save, data):
+    """Write data with orjson and with the stdlib fallback, returning both files' text"""
+    pytest.importorskip('orjson')
+    save(data, str(tmp_path / 'orjson.out'))
+    monkeypatch.setattr(ecourt_fetcher, '_import_orjson', lambda: None)
+    save(data, str(tmp_path / 'stdlib.out'))
+    return [(tmp_path / name).read_text(encoding='utf-8') for name in ('orjson.out', 'stdlib.out')]
+
+@pytest.mark.parametrize('data', SAVE_SAMPLES)
+def test_save_to_json_orjson_matches_stdlib(monkeypatch, tmp_path, data):
+    fast, slow = saved_outputs(monkeypatch, tmp_path, ecourt_fetcher.save_to_json, data)
+    assert json.loads(fast) == json.loads(slow)
+
+@pytest.mark.parametrize('data', SAVE_SAMPLES)
+def test_save_to_text_orjson_matches_stdlib(monkeypatch, tmp_path, data):
+    fast, slow = saved_outputs(monkeypatch, tmp_path, ecourt_fetcher.save_to_text, data)
+    # Lists are written one JSON document per line; anything else as a single document
+    assert [json.loads(line) for line in fast.splitlines()] == [json.loads(line) for line in slow.splitlines()]
+    assert len(fast.splitlines()) == (len(data) if isinstance(data, list) else 1)